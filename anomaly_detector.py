@@ -1,5 +1,150 @@
+import functools
+import math
+
 import numpy as np
-from collections import deque
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to plain Python
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit used when numba is not installed.
+
+        Supports both the bare (@njit) and the configured (@njit(...)) forms
+        and returns the decorated function unchanged.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Fast-math flags for the kernels. Reassociation is left out so the statistics
+# follow the written evaluation order (e.g. M2 stays exactly zero on constant
+# windows); nnan/ninf are left out so NaN inputs behave as in plain Python.
+_FASTMATH = {"nsz", "arcp", "contract", "afn"}
+
+
+@functools.lru_cache(maxsize=None)
+def _make_kernels(window_size):
+    """
+    Build the detector kernels specialized for a fixed window size.
+
+    window_size is captured as a closure variable, which numba treats as a
+    compile-time constant, so the ring-buffer modulo and loop bounds are
+    compiled with the literal value. Kernels are memoized per window size so
+    detectors of the same size share one compilation.
+
+    Args:
+        window_size (int): Size of the rolling window
+
+    Returns:
+        tuple: (_step, _batch) The per-value and whole-array kernels
+    """
+
+    @njit(cache=True, fastmath=_FASTMATH)
+    def _step(buf, head, count, evictions, mean, m2, value, threshold):
+        """
+        Process one value of the stream: test it, then add it to the window.
+
+        This is the numeric core of AnomalyDetector.is_anomaly, kept free of
+        Python objects so numba can compile it to native code. The window mean
+        and sum of squared deviations (M2) are maintained with Welford's online
+        update, extended to replace the evicted value once the window is full.
+
+        Args:
+            buf (numpy.ndarray): Ring buffer holding the rolling window
+            head (int): Index in buf where the next value will be written
+            count (int): Number of values currently held in the window
+            evictions (int): Evictions since the statistics were last recomputed
+            mean (float): Mean of the values in the window
+            m2 (float): Sum of squared deviations from the mean in the window
+            value (float): The value to check and add
+            threshold (float): Z-score threshold for anomaly detection
+
+        Returns:
+            tuple: (head, count, evictions, mean, m2, is_anomaly) The updated
+            state and whether the value is anomalous
+        """
+        is_anomaly = False
+
+        # Only test the value once enough data has been collected
+        if count >= window_size // 2 and count > 0:
+            # |z| > threshold rewritten as |x - mean| > threshold * std to avoid a
+            # division; the epsilon keeps a constant window from flagging values
+            # equal to the mean
+            if m2 > 0.0:
+                tolerance = threshold * (math.sqrt(m2 / count) + 1e-10)
+            else:
+                # M2 is only ever exactly zero here (negative values are resynced
+                # below): Welford keeps it at zero while the window is constant,
+                # so constant runs skip the sqrt without a separate range check
+                tolerance = threshold * 1e-10
+            is_anomaly = math.fabs(value - mean) > tolerance
+
+        if count == window_size:
+            # Replace the oldest value: remove it and add the new one in a single update
+            old = buf[head]
+            new_mean = mean + (value - old) / count
+            prev_m2 = m2
+            m2 += (value - old) * (value - new_mean + old - mean)
+            mean = new_mean
+            evictions += 1
+        else:
+            # Welford's update for a growing window
+            prev_m2 = 0.0
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+        buf[head] = value
+        head = (head + 1) % window_size
+
+        # Recompute the statistics periodically to stop rounding error from
+        # accumulating, and at once when evicting a large value cancelled most
+        # of M2 (or drove it negative), since the remainder is mostly rounding
+        if evictions >= window_size or m2 < 0.0 or m2 < prev_m2 * 1e-6:
+            # Sum deviations from one sample so a constant window keeps M2 at zero
+            shift = buf[0]
+            total = 0.0
+            for i in range(window_size):
+                total += buf[i] - shift
+            mean = shift + total / window_size
+            m2 = 0.0
+            for i in range(window_size):
+                m2 += (buf[i] - mean) * (buf[i] - mean)
+            evictions = 0
+
+        return head, count, evictions, mean, m2, is_anomaly
+
+    @njit(cache=True, fastmath=_FASTMATH)
+    def _batch(buf, head, count, evictions, mean, m2, values, threshold):
+        """
+        Run _step over a whole array of values in a single compiled loop.
+
+        Args:
+            buf (numpy.ndarray): Ring buffer holding the rolling window
+            head (int): Index in buf where the next value will be written
+            count (int): Number of values currently held in the window
+            evictions (int): Evictions since the statistics were last recomputed
+            mean (float): Mean of the values in the window
+            m2 (float): Sum of squared deviations from the mean in the window
+            values (numpy.ndarray): The values to check and add, in stream order
+            threshold (float): Z-score threshold for anomaly detection
+
+        Returns:
+            tuple: (mask, head, count, evictions, mean, m2) A boolean array flagging
+            the anomalous values, followed by the updated state
+        """
+        n = values.size
+        mask = np.zeros(n, dtype=np.bool_)
+        for i in range(n):
+            head, count, evictions, mean, m2, mask[i] = _step(
+                buf, head, count, evictions, mean, m2, values[i], threshold
+            )
+        return mask, head, count, evictions, mean, m2
+
+    return _step, _batch
 
 
 class AnomalyDetector:
@@ -12,17 +157,25 @@ class AnomalyDetector:
 
     The detection is performed by:
     1. Maintaining a rolling window of recent values
-    2. Computing mean and standard deviation of the window
+    2. Updating the mean and standard deviation of the window in O(1) (Welford)
     3. Converting new values to z-scores
     4. Flagging values beyond the threshold as anomalies
 
+    The per-value work is done by kernels built by _make_kernels for the
+    detector's window size, which are JIT-compiled with numba when it is installed.
+
     Attributes:
         window_size (int): Number of recent values to consider for statistics
         threshold (float): Z-score threshold for anomaly detection
-        values (collections.deque): Rolling window of recent values
+        buf (numpy.ndarray): Preallocated ring buffer holding the rolling window
+        head (int): Index in buf where the next value will be written
+        count (int): Number of values currently held in the window
         is_initialized (bool): Whether enough data has been collected
         mean (float): Rolling mean of the window
         std (float): Rolling standard deviation of the window
+        _mean (float): Mean of the values in the window
+        _m2 (float): Sum of squared deviations from the mean in the window
+        _evictions (int): Evictions since the statistics were last recomputed
     """
 
     def __init__(self, window_size=100, threshold=3):
@@ -32,22 +185,39 @@ class AnomalyDetector:
         Args:
             window_size (int): Size of the rolling window for statistics
             threshold (float): Number of standard deviations for anomaly detection
+
+        Raises:
+            ValueError: If window_size is less than 1
         """
+        if window_size < 1:
+            raise ValueError(f"window_size must be at least 1, got {window_size}")
         self.window_size = window_size
         self.threshold = threshold
-        # Use deque for efficient fixed-size window operations
-        self.values = deque(maxlen=window_size)
-        self.is_initialized = False
+        # Use a preallocated ring buffer so the window stays in contiguous memory
+        self.buf = np.empty(window_size, dtype=np.float64)
+        self.head = 0
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._evictions = 0
+        self._step, self._batch = _make_kernels(window_size)
 
-    def update_statistics(self):
-        """
-        Calculate moving statistics (mean and standard deviation) from the current window.
+    @property
+    def is_initialized(self):
+        """bool: Whether enough data has been collected to detect anomalies."""
+        return self.count > self.window_size // 2
 
-        This method is called after each new value to maintain current statistics.
-        NumPy is used for efficient array operations.
-        """
-        self.mean = np.mean(self.values)
-        self.std = np.std(self.values)
+    @property
+    def mean(self):
+        """float: Rolling mean of the window."""
+        return self._mean
+
+    @property
+    def std(self):
+        """float: Rolling standard deviation of the window."""
+        if not self.count or self._m2 <= 0:
+            return 0.0
+        return math.sqrt(self._m2 / self.count)
 
     def is_anomaly(self, value):
         """
@@ -64,26 +234,57 @@ class AnomalyDetector:
 
         Notes:
             - Initial values are never considered anomalous until enough data is collected
-            - A small epsilon (1e-10) is added to std to prevent division by zero
+            - A small epsilon (1e-10) is added to std so a constant window still has a
+              non-zero tolerance
+        """
+        (
+            self.head,
+            self.count,
+            self._evictions,
+            self._mean,
+            self._m2,
+            is_anomaly,
+        ) = self._step(
+            self.buf,
+            self.head,
+            self.count,
+            self._evictions,
+            self._mean,
+            self._m2,
+            float(value),
+            float(self.threshold),
+        )
+        return bool(is_anomaly)
+
+    def is_anomaly_batch(self, values):
+        """
+        Detect anomalies in an array of values in one call.
+
+        Equivalent to calling is_anomaly on each value in order, including the
+        effect on the rolling window, but runs the whole loop in compiled code.
+
+        Args:
+            values (array-like): The values to check, in stream order
+
+        Returns:
+            numpy.ndarray: Boolean mask, True where the value is anomalous
         """
-        # Wait for sufficient data before detecting anomalies
-        if len(self.values) < self.window_size // 2:
-            self.values.append(value)
-            return False
-
-        # Initialize statistics if this is the first time we have enough data
-        if not self.is_initialized:
-            self.update_statistics()
-            self.is_initialized = True
-
-        # Calculate z-score (how many standard deviations from mean)
-        z_score = (value - self.mean) / (
-            self.std + 1e-10
-        )  # Add epsilon to prevent division by zero
-
-        # Update rolling window and statistics
-        self.values.append(value)
-        self.update_statistics()
-
-        # Return True if absolute z-score exceeds threshold
-        return abs(z_score) > self.threshold
+        values = np.ascontiguousarray(values, dtype=np.float64).ravel()
+        (
+            mask,
+            self.head,
+            self.count,
+            self._evictions,
+            self._mean,
+            self._m2,
+        ) = self._batch(
+            self.buf,
+            self.head,
+            self.count,
+            self._evictions,
+            self._mean,
+            self._m2,
+            values,
+            float(self.threshold),
+        )
+        return mask
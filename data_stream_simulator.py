@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 
@@ -14,26 +16,82 @@ class DataStreamSimulator:
     The resulting stream mimics real-world patterns while providing
     ground truth for anomaly detection testing.
 
+    Values are generated in vectorized chunks of CHUNK_SIZE points and then
+    served one at a time, so the per-value cost is an array lookup.
+
     Attributes:
-        seasonal_period (int): Number of points in one seasonal cycle
+        seasonal_period (float): Number of points in one seasonal cycle
         trend_factor (float): Slope of the linear trend
         noise_level (float): Standard deviation of the random noise
         counter (int): Number of points generated so far
+        CHUNK_SIZE (int): Number of points precomputed at a time
+        MAX_SEASON_TABLE (int): Longest seasonal period that is tabulated
     """
 
-    def __init__(self, seasonal_period=24, trend_factor=0.1, noise_level=0.5):
+    # Class constant for the number of points generated per chunk
+    CHUNK_SIZE = 4096
+    # Class constant for the longest integer period kept as a sine table
+    MAX_SEASON_TABLE = 65536
+
+    def __init__(
+        self, seasonal_period=24, trend_factor=0.1, noise_level=0.5, seed=None
+    ):
         """
         Initialize the data stream simulator with specified parameters.
 
         Args:
-            seasonal_period (int): Period of seasonal pattern (points per cycle)
+            seasonal_period (float): Period of seasonal pattern (points per cycle)
             trend_factor (float): Strength of upward/downward trend
             noise_level (float): Amount of random noise to add
+            seed (int, optional): Seed for the random generator, for reproducible streams
         """
         self.seasonal_period = seasonal_period
         self.trend_factor = trend_factor
         self.noise_level = noise_level
         self.counter = 0
+        # Angular step of the seasonal sine wave per point
+        self._omega = 2.0 * math.pi / seasonal_period
+        # For positive integer periods, tabulate one full cycle indexed by
+        # counter % period; other periods evaluate the sine per chunk instead
+        if (
+            float(seasonal_period).is_integer()
+            and 0 < seasonal_period <= self.MAX_SEASON_TABLE
+        ):
+            self._season_lut = np.sin(self._omega * np.arange(int(seasonal_period)))
+        else:
+            self._season_lut = None
+        # A dedicated PCG64 generator avoids the legacy global np.random state
+        self._rng = np.random.default_rng(seed)
+        self._buf = None
+        self._idx = self.CHUNK_SIZE
+
+    def _generate_chunk(self):
+        """
+        Precompute the next CHUNK_SIZE values of the stream.
+
+        Every component of get_next_value is computed for the whole chunk with
+        array operations instead of one scalar NumPy call per value.
+        """
+        n = self.CHUNK_SIZE
+        t = np.arange(self.counter, self.counter + n)
+
+        # Seasonal pattern, linear trend and random noise
+        if self._season_lut is not None:
+            seasonal = self._season_lut[t % self._season_lut.size]
+        else:
+            seasonal = np.sin(self._omega * t)
+        trend = self.trend_factor * t
+        noise = self._rng.standard_normal(n) * self.noise_level
+
+        # Anomalies (1% probability), negative ones made more pronounced
+        mask = self._rng.random(n) < 0.01
+        directions = np.where(self._rng.random(n) < 0.5, -1, 1)
+        magnitudes = 5 + 5 * self._rng.random(n)
+        magnitudes = np.where(directions < 0, magnitudes * 1.5, magnitudes)
+        anomaly = np.where(mask, directions * magnitudes, 0.0)
+
+        self._buf = seasonal + trend + noise + anomaly
+        self._idx = 0
 
     def get_next_value(self):
         """
@@ -48,25 +106,10 @@ class DataStreamSimulator:
         Returns:
             float: The next value in the sequence
         """
-        # Generate seasonal pattern using sine wave
-        seasonal = np.sin(2 * np.pi * self.counter / self.seasonal_period)
-
-        # Add linear trend
-        trend = self.trend_factor * self.counter
-
-        # Add random noise from normal distribution
-        noise = np.random.normal(0, self.noise_level)
-
-        # Randomly inject anomalies (1% probability)
-        if np.random.random() < 0.01:
-            # Equal probability of positive or negative anomalies
-            direction = np.random.choice([-1, 1])
-            magnitude = np.random.uniform(5, 10)
-            if direction == -1:
-                magnitude *= 1.5  # Make negative anomalies more pronounced
-            anomaly = direction * magnitude
-        else:
-            anomaly = 0
+        if self._idx == self.CHUNK_SIZE:
+            self._generate_chunk()
 
+        value = float(self._buf[self._idx])
+        self._idx += 1
         self.counter += 1
-        return seasonal + trend + noise + anomaly
+        return value
@@ -1,4 +1,7 @@
+import gc
 import logging
+import logging.handlers
+import queue
 import time
 from anomaly_detector import AnomalyDetector
 from data_stream_simulator import DataStreamSimulator
@@ -7,20 +10,38 @@ import matplotlib.pyplot as plt
 import signal
 
 
-# Set up logging
-logging.basicConfig(filename="anomalies.log", level=logging.INFO)
+# Set up logging: records are queued here and written to disk by a background listener
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(
+    log_queue, logging.FileHandler("anomalies.log", delay=True)
+)
+logging.basicConfig(
+    level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)]
+)
 
 
 class AnomalyDetectionSystem:
     """
     Coordinates the anomaly detection components and handles shutdown.
+
+    Samples are processed as fast as they are generated; the plot is only
+    redrawn once every FRAME_INTERVAL seconds. Log records are written to
+    disk by a background thread so the main loop never blocks on file I/O.
+    Automatic garbage collection is paused while running and replaced by a
+    collection every GC_INTERVAL seconds.
     """
 
+    # Class constant for the minimum time between redraws (30 FPS)
+    FRAME_INTERVAL = 1 / 30
+    # Class constant for the time between manual garbage collections
+    GC_INTERVAL = 1.0
+
     def __init__(self):
         self.running = True
         self.detector = AnomalyDetector(window_size=50, threshold=2.5)
         self.simulator = DataStreamSimulator(noise_level=0.3)
         self.visualizer = RealTimeVisualizer()
+        log_listener.start()
 
         # Set up signal handlers
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -34,18 +55,32 @@ class AnomalyDetectionSystem:
     def run(self):
         """Main loop with proper resource cleanup"""
         try:
+            # Collect garbage on a timer instead of on allocation counts
+            gc.disable()
+            self._last_draw = self._last_gc = time.monotonic()
             while self.running:
                 value = self.simulator.get_next_value()
                 is_anomaly = self.detector.is_anomaly(value)
 
+                self.visualizer.push(self.simulator.counter, value, is_anomaly)
+
+                # Only redraw when a frame is due
+                now = time.monotonic()
+                if now - self._last_draw < self.FRAME_INTERVAL:
+                    continue
+
+                if now - self._last_gc >= self.GC_INTERVAL:
+                    gc.collect()
+                    self._last_gc = now
+
                 # Check if visualization was successful
-                if not self.visualizer.update(
-                    self.simulator.counter, value, is_anomaly
-                ):
+                if not self.visualizer.flush_to_plot():
                     self.running = False
                     break
 
-                time.sleep(0.05)
+                # Time the next frame from the end of this redraw, so a slow draw
+                # is still followed by a full interval of sample processing
+                self._last_draw = time.monotonic()
 
         except Exception as e:
             print(f"\nError occurred: {e}")
@@ -57,6 +92,9 @@ class AnomalyDetectionSystem:
         print("\nCleaning up resources...")
         self.visualizer.cleanup()
         plt.ioff()  # Turn off interactive mode
+        log_listener.stop()  # Flush queued log records
+        gc.enable()
+        gc.collect()
         print("Shutdown complete.")
 
 
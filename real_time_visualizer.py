@@ -1,6 +1,5 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from collections import deque
 
 
 class RealTimeVisualizer:
@@ -13,23 +12,41 @@ class RealTimeVisualizer:
     3. Moving window of recent values
     4. Automatic axis scaling
 
-    Uses Matplotlib's interactive mode for real-time updates.
+    Uses Matplotlib's interactive mode for real-time updates. When the canvas
+    supports blitting, only the data artists are redrawn over a cached
+    background; the full figure is redrawn only when the axis limits change.
+    Blitting therefore only pays off when few points arrive between redraws
+    (e.g. one update() per sample): once a frame covers more than about
+    LIMIT_TOLERANCE of the x window, the x-axis moves on every frame and each
+    flush_to_plot is a full redraw, as in the throttled main loop.
+
+    The line data is kept in one preallocated (2 * max_points, 2) NumPy buffer
+    of (timestamp, value) rows. Every sample is written at its slot and at the
+    slot one window further on, so the window in time order is always a single
+    (strided, for each column) slice of the same reused storage, and no lists
+    or stacked arrays are built per frame. Matplotlib still copies the data it
+    is given (set_data and set_offsets keep their own arrays). Anomalies are
+    drawn as an unordered scatter, so they live in a plain (max_points, 2)
+    ring whose filled rows are passed to the scatter directly.
 
     Attributes:
         max_points (int): Maximum number of points to display
-        timestamps (collections.deque): Rolling window of time values
-        values (collections.deque): Rolling window of data values
-        anomalies_x (collections.deque): Timestamps of detected anomalies
-        anomalies_y (collections.deque): Values of detected anomalies
+        timestamps (numpy.ndarray): Rolling window of time values
+        values (numpy.ndarray): Rolling window of data values
+        anomalies_x (numpy.ndarray): Timestamps of detected anomalies
+        anomalies_y (numpy.ndarray): Values of detected anomalies
         fig (matplotlib.figure.Figure): The main figure object
         ax (matplotlib.axes.Axes): The plot axes object
         line (matplotlib.lines.Line2D): The main data line
         anomaly_scatter (matplotlib.collections.PathCollection): The anomaly points
         MIN_Y_RANGE (float): Minimum range for y-axis to prevent singular transformation
+        LIMIT_TOLERANCE (float): Fraction of the axis span the limits may drift before rescaling
     """
 
     # Class constant for minimum y-axis range
     MIN_Y_RANGE = 1.0
+    # Class constant for how far limits may drift (as a fraction of span) before rescaling
+    LIMIT_TOLERANCE = 0.05
 
     def __init__(self, max_points=200):
         """
@@ -39,18 +56,25 @@ class RealTimeVisualizer:
             max_points (int): Maximum number of points to display in the window
         """
         self.max_points = max_points
-        # Initialize deques for efficient fixed-size data storage
-        self.timestamps = deque(maxlen=max_points)
-        self.values = deque(maxlen=max_points)
-        self.anomalies_x = deque(maxlen=max_points)
-        self.anomalies_y = deque(maxlen=max_points)
+        # Preallocate mirrored ring buffers for fixed-size data storage
+        self._line_xy = np.empty((2 * max_points, 2))
+        self._line_x = self._line_xy[:, 0]
+        self._line_y = self._line_xy[:, 1]
+        self._cursor = 0
+        self._size = 0
+        self._anom_xy = np.empty((max_points, 2))
+        self._anom_head = 0
+        self._anom_count = 0
 
         # Set up the plot in interactive mode
         plt.ion()
         self.fig, self.ax = plt.subplots(figsize=(12, 6))
-        (self.line,) = self.ax.plot([], [], "b-", label="Data Stream")
+        # When blitting, data artists are animated so they are left out of the
+        # cached background; otherwise they must be part of the normal draw
+        blit = self.fig.canvas.supports_blit
+        (self.line,) = self.ax.plot([], [], "b-", label="Data Stream", animated=blit)
         self.anomaly_scatter = self.ax.scatter(
-            [], [], color="red", marker="o", s=100, label="Anomalies"
+            [], [], color="red", marker="o", s=100, label="Anomalies", animated=blit
         )
 
         # Configure plot appearance
@@ -60,6 +84,92 @@ class RealTimeVisualizer:
         self.ax.legend()
         self.ax.grid(True, linestyle="--", alpha=0.7)
 
+        # Re-cache the background whenever the full figure is drawn (e.g. on resize)
+        self._background = None
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _window(self, buf, cursor, size):
+        """
+        Return the contents of a mirrored ring buffer in insertion order.
+
+        Args:
+            buf (numpy.ndarray): Buffer (or column view) of length 2 * max_points
+            cursor (int): Slot the next sample will be written to
+            size (int): Number of samples currently held
+
+        Returns:
+            numpy.ndarray: A view of the held samples, oldest first
+        """
+        if size < self.max_points:
+            return buf[:size]
+        return buf[cursor : cursor + self.max_points]
+
+    @property
+    def timestamps(self):
+        """numpy.ndarray: Rolling window of time values, oldest first."""
+        return self._window(self._line_x, self._cursor, self._size)
+
+    @property
+    def values(self):
+        """numpy.ndarray: Rolling window of data values, oldest first."""
+        return self._window(self._line_y, self._cursor, self._size)
+
+    def _anomalies_in_order(self):
+        """
+        Return the stored anomalies as (timestamp, value) rows, oldest first.
+
+        Returns:
+            numpy.ndarray: Array of shape (n, 2), a copy once the ring has wrapped
+        """
+        if self._anom_count < self.max_points:
+            return self._anom_xy[: self._anom_count]
+        return np.roll(self._anom_xy, -self._anom_head, axis=0)
+
+    @property
+    def anomalies_x(self):
+        """numpy.ndarray: Timestamps of detected anomalies, oldest first."""
+        return self._anomalies_in_order()[:, 0]
+
+    @property
+    def anomalies_y(self):
+        """numpy.ndarray: Values of detected anomalies, oldest first."""
+        return self._anomalies_in_order()[:, 1]
+
+    def _on_draw(self, event):
+        """
+        Cache the freshly drawn axes background and draw the data artists on top.
+
+        Args:
+            event (matplotlib.backend_bases.DrawEvent): The draw event
+        """
+        if not self.fig.canvas.supports_blit:
+            return
+        self._background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
+        self.ax.draw_artist(self.anomaly_scatter)
+
+    def _needs_rescale(self, current, new, point):
+        """
+        Decide whether an axis should be rescaled to new limits.
+
+        Small drifts of the limits are ignored to avoid a full redraw on every
+        update, unless the newest point would fall outside the current view.
+
+        Args:
+            current (tuple): Current (min, max) limits of the axis
+            new (tuple): Desired (min, max) limits of the axis
+            point (float): Newest data coordinate along the axis
+
+        Returns:
+            bool: True if the axis limits should be updated
+        """
+        if not current[0] <= point <= current[1]:
+            return True
+        tolerance = self.LIMIT_TOLERANCE * (current[1] - current[0])
+        return (
+            abs(new[0] - current[0]) > tolerance or abs(new[1] - current[1]) > tolerance
+        )
+
     def _calculate_y_limits(self, y_min, y_max):
         """
         Calculate appropriate y-axis limits to prevent singular transformations.
@@ -84,52 +194,104 @@ class RealTimeVisualizer:
         padding = 0.1 * y_range
         return y_min - padding, y_max + padding
 
-    def update(self, timestamp, value, is_anomaly):
+    def push(self, timestamp, value, is_anomaly):
         """
-        Update the visualization with new data.
+        Record a new data point without touching the plot.
 
-        Handles both regular data points and anomalies, updating the plot
-        and adjusting axes as needed for optimal visualization.
+        This only writes into the ring buffers, so it is cheap enough to call
+        for every sample; the point is shown on the next call to flush_to_plot.
 
         Args:
             timestamp (float): Current timestamp
             value (float): Current value
             is_anomaly (bool): Whether the current value is anomalous
         """
-        # Update main data collections
-        self.timestamps.append(timestamp)
-        self.values.append(value)
+        m = self.max_points
+
+        # Update main data collections, writing each sample to both mirrored slots
+        i = self._cursor
+        self._line_xy[i] = self._line_xy[i + m] = (timestamp, value)
+        self._cursor = (i + 1) % m
+        self._size = min(self._size + 1, m)
 
         # Store anomalies separately for scatter plot
         if is_anomaly:
-            self.anomalies_x.append(timestamp)
-            self.anomalies_y.append(value)
+            self._anom_xy[self._anom_head] = (timestamp, value)
+            self._anom_head = (self._anom_head + 1) % m
+            self._anom_count = min(self._anom_count + 1, m)
 
-        # Update plot data
-        self.line.set_data(list(self.timestamps), list(self.values))
-        self.anomaly_scatter.set_offsets(
-            np.c_[list(self.anomalies_x), list(self.anomalies_y)]
-        )
+    def flush_to_plot(self):
+        """
+        Redraw the plot with every point recorded so far.
+
+        Hands the current windows to the artists once, however many points
+        were pushed since the last call, and adjusts axes as needed for
+        optimal visualization. If the x window advanced by more than
+        LIMIT_TOLERANCE of its span since the last call, this is a full
+        redraw rather than a blit.
+
+        Returns:
+            bool: False if the plot window has been closed, True otherwise
+        """
+        # Hand slices of the reused buffers to the artists; matplotlib copies them
+        timestamps, values = self.timestamps, self.values
+        self.line.set_data(timestamps, values)
+        self.anomaly_scatter.set_offsets(self._anom_xy[: self._anom_count])
+
+        rescaled = False
 
-        # Calculate and set y-axis limits with proper range handling
-        if len(self.values) > 0:  # Check if we have any values
-            y_min, y_max = min(self.values), max(self.values)
-            y_min_limit, y_max_limit = self._calculate_y_limits(y_min, y_max)
-            self.ax.set_ylim(y_min_limit, y_max_limit)
+        if len(values) > 0:  # Check if we have any values
+            timestamp, value = timestamps[-1], values[-1]
 
-        # Update x-axis limits to show recent window
-        x_min = max(0, timestamp - self.max_points)
-        self.ax.set_xlim(x_min, timestamp + 5)
+            # Calculate and set y-axis limits with proper range handling.
+            # Extremes are scanned once per frame on the contiguous window rather
+            # than tracked in push, which runs for every sample
+            y_min, y_max = values.min(), values.max()
+            y_limits = self._calculate_y_limits(y_min, y_max)
+            if self._needs_rescale(self.ax.get_ylim(), y_limits, value):
+                self.ax.set_ylim(*y_limits)
+                rescaled = True
 
-        # Redraw the plot
+            # Update x-axis limits to show recent window
+            x_limits = (max(0, timestamp - self.max_points), timestamp + 5)
+            if self._needs_rescale(self.ax.get_xlim(), x_limits, timestamp):
+                self.ax.set_xlim(*x_limits)
+                rescaled = True
+
+        # Redraw the plot, blitting only the data artists when possible
         try:
-            self.fig.canvas.draw()
-            self.fig.canvas.flush_events()
+            canvas = self.fig.canvas
+            if rescaled or self._background is None or not canvas.supports_blit:
+                canvas.draw()
+            else:
+                canvas.restore_region(self._background)
+                self.ax.draw_artist(self.line)
+                self.ax.draw_artist(self.anomaly_scatter)
+                canvas.blit(self.ax.bbox)
+            canvas.flush_events()
         except Exception:
             # Handle case where window is closed
             return False
         return True
 
+    def update(self, timestamp, value, is_anomaly):
+        """
+        Update the visualization with new data.
+
+        Convenience wrapper that records the point with push and then redraws
+        with flush_to_plot.
+
+        Args:
+            timestamp (float): Current timestamp
+            value (float): Current value
+            is_anomaly (bool): Whether the current value is anomalous
+
+        Returns:
+            bool: False if the plot window has been closed, True otherwise
+        """
+        self.push(timestamp, value, is_anomaly)
+        return self.flush_to_plot()
+
     def cleanup(self):
         """Clean up matplotlib resources"""
         plt.close(self.fig)
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from anomaly_detector import AnomalyDetector
 
 
@@ -21,18 +22,57 @@ class TestAnomalyDetector(unittest.TestCase):
 
     def test_dynamic_detection(self):
         detector = AnomalyDetector(window_size=10, threshold=2.5)
-        # Insert normal values
-        normal_values = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-        for value in normal_values:
+        # Normal values, then an anomaly, then a normal value again
+        values = np.array([1] * 10 + [10] + [1], dtype=np.float64)
+        mask = detector.is_anomaly_batch(values)
+
+        self.assertFalse(mask[:10].any())  # Normal values are not flagged
+        self.assertTrue(mask[10])  # The anomaly should be detected
+        # Check that the next normal value doesn't trigger an anomaly
+        self.assertFalse(mask[11])
+
+    def test_batch_matches_streaming(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(0, 1, 500)
+        values[::37] += 8  # Inject spikes
+        streaming = AnomalyDetector(window_size=20, threshold=2.5)
+        expected = [streaming.is_anomaly(value) for value in values]
+
+        batch = AnomalyDetector(window_size=20, threshold=2.5)
+        # Split the run so state must carry over between batch calls
+        mask = np.concatenate(
+            [batch.is_anomaly_batch(values[:123]), batch.is_anomaly_batch(values[123:])]
+        )
+        self.assertEqual(mask.dtype, np.bool_)
+        self.assertEqual(mask.tolist(), expected)
+        self.assertEqual(batch.is_anomaly(10), streaming.is_anomaly(10))
+
+    def test_statistics_with_large_offset(self):
+        detector = AnomalyDetector(window_size=10, threshold=2.5)
+        values = 1e9 + np.arange(25) % 4  # Small spread on a large offset
+        detector.is_anomaly_batch(values)
+        self.assertAlmostEqual(detector.mean, np.mean(values[-10:]), places=6)
+        self.assertAlmostEqual(detector.std, np.std(values[-10:]), places=6)
+
+    def test_statistics_after_large_value_leaves(self):
+        detector = AnomalyDetector(window_size=50, threshold=2.5)
+        values = np.random.default_rng(0).normal(1, 0.3, 3000)
+        values[::997] = 1e8  # Huge spikes that later drop out of the window
+        for value in values:
             detector.is_anomaly(value)
+            if detector.count == detector.window_size:
+                self.assertAlmostEqual(detector.std / np.std(detector.buf), 1, places=3)
 
-        # Now we introduce an anomaly
-        anomaly_value = 10
-        is_anomaly = detector.is_anomaly(anomaly_value)
-        self.assertTrue(is_anomaly)  # The anomaly should be detected
+    def test_constant_window(self):
+        detector = AnomalyDetector(window_size=10, threshold=2.5)
+        mask = detector.is_anomaly_batch(np.full(50, 0.1))
+        self.assertFalse(mask.any())
+        self.assertEqual(detector.std, 0.0)  # Exactly zero, no rounding residue
+        self.assertTrue(detector.is_anomaly(0.1 + 1e-6))
 
-        # Check that the next normal value doesn't trigger an anomaly
-        self.assertFalse(detector.is_anomaly(1))
+    def test_invalid_window_size(self):
+        with self.assertRaises(ValueError):
+            AnomalyDetector(window_size=0)
 
 
 if __name__ == "__main__":
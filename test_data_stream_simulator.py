@@ -23,6 +23,14 @@ class TestDataStreamSimulator(unittest.TestCase):
                 anomalies_count += 1
         self.assertGreater(anomalies_count, 0)  # Expect at least one anomaly
 
+    def test_seed_reproducible(self):
+        first = DataStreamSimulator(seed=42)
+        second = DataStreamSimulator(seed=42)
+        self.assertEqual(
+            [first.get_next_value() for _ in range(100)],
+            [second.get_next_value() for _ in range(100)],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()